@@ -11,14 +11,23 @@ interface EventDetailPageProps {
 export default async function EventDetailPage({ params }: EventDetailPageProps) {
   const { id } = await params
 
-  // Hole Event aus der Datenbank
-  const { data: event, error } = await supabase
+  // Hole Event aus der Datenbank (vergangene Events liegen im Archiv)
+  let { data: event } = await supabase
     .from('events')
     .select('*')
     .eq('id', id)
-    .single()
+    .maybeSingle()
+
+  if (!event) {
+    const { data: archivedEvent } = await supabase
+      .from('events_archive')
+      .select('*')
+      .eq('id', id)
+      .maybeSingle()
+    event = archivedEvent
+  }
 
-  if (error || !event) {
+  if (!event) {
     notFound()
   }
 
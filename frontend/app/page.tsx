@@ -1,19 +1,38 @@
+import { readFile } from 'fs/promises'
+import path from 'path'
 import { supabase } from '@/lib/supabase'
 import { Event } from '@/types/database'
 import EventDashboard from '@/components/EventDashboard'
 
-export default async function Home() {
-  // Lade Events server-seitig
+// Vorberechneter Feed aus der nächtlichen Pipeline (scripts/build_static_feed.py)
+const FEED_PATH = path.join(process.cwd(), 'public', 'feed', 'events.json')
+
+async function loadEvents(): Promise<Event[]> {
+  try {
+    const feed = await readFile(FEED_PATH, 'utf-8')
+    return JSON.parse(feed) as Event[]
+  } catch {
+    // Kein Feed vorhanden (z.B. lokale Entwicklung) - Fallback auf Live-Abfrage
+  }
+
+  // Nur kommende Events - vergangene liegen in events_archive
+  const today = new Date().toISOString().slice(0, 10)
   const { data: events, error } = await supabase
     .from('events')
     .select('*')
+    .gte('date', today)
     .order('date', { ascending: true })
 
   if (error) {
     console.error('Error loading events:', error)
   }
 
-  const eventsList: Event[] = events || []
+  return events || []
+}
+
+export default async function Home() {
+  // Lade Events server-seitig
+  const eventsList: Event[] = await loadEvents()
 
   return (
     <div className="min-h-screen bg-slate-50">
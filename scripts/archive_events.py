@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Archiv-Job: Verschiebt vergangene Events von `events` nach `events_archive`.
+
+Voraussetzung: scripts/create_events_archive.sql wurde ausgeführt. Im nächtlichen
+Workflow ist der Schritt nicht blockierend, ohne Migration läuft der Scraper also weiter.
+Das Verschieben passiert serverseitig in Blöcken (RPC archive_past_events),
+es werden also keine Event-Daten über die Leitung geschickt.
+"""
+
+import argparse
+from datetime import date
+from utils import get_supabase_client
+
+# Obergrenze pro Aufruf, wird auch serverseitig erzwungen
+MAX_BATCH_SIZE = 10000
+
+
+def count_archivable(supabase):
+    """Zählt vergangene Events (date < heute), ohne Zeilen zu übertragen."""
+    response = supabase.table('events')\
+        .select('id', count='exact', head=True)\
+        .lt('date', date.today().isoformat())\
+        .execute()
+    return response.count or 0
+
+
+def archive_past_events(batch_size=1000, dry_run=False):
+    """
+    Verschiebt alle Events vor dem heutigen Tag ins Archiv.
+
+    Der Stichtag wird serverseitig bestimmt (CURRENT_DATE), siehe create_events_archive.sql.
+
+    Returns:
+        Anzahl verschobener (bzw. bei dry_run: verschiebbarer) Events
+    """
+    batch_size = max(1, min(batch_size, MAX_BATCH_SIZE))
+    supabase = get_supabase_client()
+
+    if dry_run:
+        return count_archivable(supabase)
+
+    total_moved = 0
+    while True:
+        response = supabase.rpc('archive_past_events', {'batch_size': batch_size}).execute()
+        moved = response.data or 0
+        total_moved += moved
+        if moved:
+            print(f"  ✓ {total_moved} Events archiviert...")
+        if moved < batch_size:
+            return total_moved
+
+
+def main(argv=None):
+    """Hauptfunktion"""
+    parser = argparse.ArgumentParser(description='Archiviert vergangene Events')
+    parser.add_argument('--batch-size', type=int, default=1000,
+                        help=f'Events pro Datenbank-Aufruf (Standard: 1000, max. {MAX_BATCH_SIZE})')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='Nur zählen, nichts verschieben')
+    args = parser.parse_args(argv)
+
+    print("\n🗄️  Archiviere vergangene Events...\n")
+    count = archive_past_events(batch_size=args.batch_size, dry_run=args.dry_run)
+
+    if args.dry_run:
+        print(f"🔎 {count} Events würden archiviert.\n")
+    else:
+        print(f"\n✅ Fertig! {count} Events archiviert.\n")
+
+
+if __name__ == '__main__':
+    main()
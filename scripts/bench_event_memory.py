@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Speicher-Benchmark: Event-Dicts (bisheriges Format des Scrapers) vs. EventRecord.
+
+Beide Varianten bekommen dieselben Eingaben (Name, Link, Datum, Distanz) wie sie
+der Scraper aus dem HTML erhält. Gemessen wird der zusätzlich belegte Speicher
+per tracemalloc, nachdem die Liste vollständig aufgebaut ist.
+
+    python bench_event_memory.py --count 100000
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from utils import EventRecord
+
+
+def make_inputs(count):
+    """Rohdaten wie aus dem HTML: Name, Link, datetime, Distanz-String."""
+    start = datetime(2026, 1, 1)
+    return [
+        (
+            f"Stadtlauf Marathon Nr. {i}",
+            f"https://www.marathon.de/laufkalender/event-{i}",
+            start + timedelta(days=i % 730),
+            '42km' if i % 2 else '21km',
+        )
+        for i in range(count)
+    ]
+
+
+def build_dicts(inputs):
+    # Genau wie der bisherige Scraper (type/category als gemeinsames Literal)
+    return [
+        {
+            "name": name,
+            "date": event_date.strftime("%Y-%m-%d"),
+            "location": None,
+            "distance": float(distance_km.replace('km', '')),
+            "link": link,
+            "type": "Laufen",
+            "category": "Laufen"
+        }
+        for name, link, event_date, distance_km in inputs
+    ]
+
+
+def build_records(inputs):
+    return [
+        EventRecord(
+            name=name,
+            date=event_date.date(),
+            distance=float(distance_km.replace('km', '')),
+            link=link,
+            category="Laufen",
+            type="Laufen",
+        )
+        for name, link, event_date, distance_km in inputs
+    ]
+
+
+def measure(builder, inputs):
+    """Liefert (zusätzliche Bytes, Sekunden) für den Aufbau der Liste."""
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    events = builder(inputs)
+    elapsed = time.perf_counter() - started
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del events
+    return current, elapsed
+
+
+def main(argv=None):
+    """Hauptfunktion"""
+    parser = argparse.ArgumentParser(description='Vergleicht den Speicherbedarf von Event-Dicts und EventRecord')
+    parser.add_argument('--count', type=int, default=100_000, help='Anzahl Events (Standard: 100000)')
+    args = parser.parse_args(argv)
+
+    inputs = make_inputs(args.count)
+    dict_bytes, dict_seconds = measure(build_dicts, inputs)
+    record_bytes, record_seconds = measure(build_records, inputs)
+
+    print(f"\n📏 Speicherbedarf für {args.count} Events (ohne gemeinsame Eingabe-Strings):\n")
+    print(f"  • dict:        {dict_bytes / 1024 / 1024:7.1f} MB  ({dict_bytes / args.count:5.0f} B/Event, {dict_seconds:.2f}s)")
+    print(f"  • EventRecord: {record_bytes / 1024 / 1024:7.1f} MB  ({record_bytes / args.count:5.0f} B/Event, {record_seconds:.2f}s)")
+    print(f"\n✅ EventRecord braucht {100 * (1 - record_bytes / dict_bytes):.0f}% weniger Speicher.\n")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Erzeugt vorberechnete, statische Event-Feeds für das Frontend.
+
+Läuft im nächtlichen Workflow nach Scraper und Geocoder. Die Dateien landen in
+frontend/public/feed und werden von der Startseite statt einer Live-Abfrage gelesen:
+
+    events.json            - alle kommenden Events, nach Datum sortiert
+    distance-42.195.json   - nur Marathon-Distanz
+    distance-21.1.json     - nur Halbmarathon-Distanz
+    tiles.json             - grober Geohash-Index (Kachel -> Event-IDs)
+    meta.json              - Datumsbereich und Anzahl Einträge pro Datei
+
+Die Ausgabe ist deterministisch, damit unveränderte Daten keine Git-Änderung erzeugen.
+Komprimiert wird beim Ausliefern (Next.js/CDN), nicht im Repository.
+"""
+
+import argparse
+import json
+import os
+import time
+from utils import get_supabase_client, iter_event_batches, encode_geohash
+
+DEFAULT_OUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'frontend', 'public', 'feed')
+
+# Spalten, die Dashboard und Karte tatsächlich anzeigen
+FEED_COLUMNS = [
+    'id', 'name', 'title', 'category', 'type', 'location', 'city', 'date',
+    'distance', 'price', 'capacity', 'image_url', 'link', 'lat', 'lng',
+]
+
+# Gleiche Distanzen und Toleranz wie der Distanz-Filter in EventDashboard.tsx
+DISTANCE_SHARDS = {
+    '42.195': 42.195,
+    '21.1': 21.1,
+}
+DISTANCE_TOLERANCE_KM = 0.1
+
+TILE_PRECISION = 4  # ca. 39 x 20 km pro Kachel
+
+
+def load_upcoming_events(supabase):
+    """Lädt alle Events ab heute und sortiert sie nach Datum."""
+    events = []
+    for batch in iter_event_batches(supabase, columns=','.join(FEED_COLUMNS)):
+        events.extend({column: row.get(column) for column in FEED_COLUMNS} for row in batch)
+
+    events.sort(key=lambda e: (e['date'] or '', e['id']))
+    return events
+
+
+def build_distance_shards(events):
+    shards = {}
+    for label, target in DISTANCE_SHARDS.items():
+        shards[label] = [
+            e for e in events
+            if e['distance'] and abs(float(e['distance']) - target) < DISTANCE_TOLERANCE_KM
+        ]
+    return shards
+
+
+def build_tile_index(events, precision=TILE_PRECISION):
+    tiles = {}
+    for event in events:
+        if event['lat'] is None or event['lng'] is None:
+            continue
+        tile = encode_geohash(float(event['lat']), float(event['lng']), precision)
+        tiles.setdefault(tile, []).append(event['id'])
+    return {'precision': precision, 'tiles': dict(sorted(tiles.items()))}
+
+
+def write_json(out_dir, filename, payload):
+    """Schreibt kompaktes, stabil sortiertes JSON."""
+    data = json.dumps(payload, ensure_ascii=False, separators=(',', ':'), sort_keys=True).encode('utf-8')
+
+    path = os.path.join(out_dir, filename)
+    with open(path, 'wb') as f:
+        f.write(data)
+
+    return len(data)
+
+
+def build_static_feed(out_dir=DEFAULT_OUT_DIR):
+    """
+    Baut alle Feed-Dateien neu.
+
+    Returns:
+        Anzahl der Events im Haupt-Feed
+    """
+    supabase = get_supabase_client()
+    events = load_upcoming_events(supabase)
+    print(f"   Gefunden: {len(events)} kommende Events")
+
+    os.makedirs(out_dir, exist_ok=True)
+    counts = {}
+
+    size = write_json(out_dir, 'events.json', events)
+    counts['events.json'] = len(events)
+    print(f"  ✓ events.json ({len(events)} Events, {size / 1024:.1f} KB)")
+
+    shards = build_distance_shards(events)
+    for label, shard in shards.items():
+        filename = f'distance-{label}.json'
+        size = write_json(out_dir, filename, shard)
+        counts[filename] = len(shard)
+        print(f"  ✓ {filename} ({len(shard)} Events, {size / 1024:.1f} KB)")
+
+    # Plausibilitäts-Check: Events mit Distanz, aber leere Shards deuten auf
+    # abweichende Distanzwerte in der Datenbank hin
+    with_distance = sum(1 for e in events if e['distance'])
+    if with_distance and not any(shards.values()):
+        print(f"  ⚠️  Warnung: {with_distance} Events haben eine Distanz, aber alle Distanz-Shards sind leer")
+
+    tile_index = build_tile_index(events)
+    size = write_json(out_dir, 'tiles.json', tile_index)
+    counts['tiles.json'] = len(tile_index['tiles'])
+    print(f"  ✓ tiles.json ({len(tile_index['tiles'])} Kacheln, {size / 1024:.1f} KB)")
+
+    # meta.json ändert sich nur, wenn sich auch der Inhalt ändert
+    write_json(out_dir, 'meta.json', {
+        'counts': counts,
+        'first_date': events[0]['date'] if events else None,
+        'last_date': events[-1]['date'] if events else None,
+    })
+
+    return len(events)
+
+
+def main(argv=None):
+    """Hauptfunktion"""
+    parser = argparse.ArgumentParser(description='Erzeugt statische Event-Feeds für das Frontend')
+    parser.add_argument('--out', default=DEFAULT_OUT_DIR,
+                        help='Zielverzeichnis (Standard: frontend/public/feed)')
+    args = parser.parse_args(argv)
+
+    print("\n🗂️  Erzeuge statische Event-Feeds...\n")
+    started = time.perf_counter()
+    count = build_static_feed(os.path.normpath(args.out))
+    elapsed = time.perf_counter() - started
+    print(f"\n✅ Fertig! Feed mit {count} Events in {elapsed:.1f}s erzeugt.\n")
+
+
+if __name__ == '__main__':
+    main()
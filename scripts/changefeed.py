@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Change-Feed der Events: Append-only Protokoll aller Änderungen aus der Pipeline.
+
+Schreiben (Scraper, Geocoder):
+    change_log = ChangeLog()
+    change_log.record('update', event_id, {'date': '2026-04-12'})
+    change_log.flush()
+
+Lesen (Verbraucher merken sich die zuletzt verarbeitete seq):
+    for change in iter_changes_since(last_seq):
+        ...
+        last_seq = change['seq']
+
+Voraussetzung: scripts/create_event_changes_table.sql wurde ausgeführt.
+"""
+
+import argparse
+from utils import get_supabase_client
+
+CHANGES_TABLE = 'event_changes'
+CHANGE_KINDS = ('insert', 'update', 'geocoded')
+
+
+def diff_fields(old, new):
+    """
+    Vergleicht zwei Event-Dicts.
+
+    Returns:
+        Dict der Felder aus `new`, deren Wert sich gegenüber `old` geändert hat
+    """
+    return {key: value for key, value in new.items() if old.get(key) != value}
+
+
+class ChangeLog:
+    """
+    Sammelt Änderungen und schreibt sie gebündelt in die event_changes-Tabelle.
+
+    record() puffert nur. Geschrieben wird mit flush_if_full() bzw. flush(); Fehler
+    beim Schreiben werden gemeldet und gezählt, aber nie an den Aufrufer
+    weitergereicht - ein fehlender Change-Feed darf den Ingest nicht stören.
+    """
+
+    def __init__(self, supabase=None, batch_size=100):
+        self.supabase = supabase
+        self.batch_size = batch_size
+        self.pending = []
+        self.written = 0
+        self.failed = 0
+
+    def record(self, kind, event_id, fields):
+        """Merkt eine Änderung vor (wird erst bei flush() geschrieben)."""
+        if kind not in CHANGE_KINDS:
+            raise ValueError(f"Unbekannte Änderungsart '{kind}', erlaubt: {', '.join(CHANGE_KINDS)}")
+        if not fields:
+            return
+
+        self.pending.append({'event_id': event_id, 'kind': kind, 'fields': fields})
+
+    def flush_if_full(self):
+        """Schreibt, sobald batch_size Änderungen vorgemerkt sind."""
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Schreibt alle vorgemerkten Änderungen in einem Insert.
+
+        Schlägt das Schreiben fehl (z.B. Tabelle noch nicht angelegt), werden die
+        Einträge verworfen und in `failed` gezählt, statt es endlos erneut zu versuchen.
+        """
+        if not self.pending:
+            return
+        batch, self.pending = self.pending, []
+        try:
+            supabase = self.supabase or get_supabase_client()
+            supabase.table(CHANGES_TABLE).insert(batch, returning='minimal').execute()
+        except Exception as e:
+            self.failed += len(batch)
+            print(f"  ⚠️  Change-Feed: {len(batch)} Einträge konnten nicht geschrieben werden: {e}")
+            return
+        self.written += len(batch)
+
+
+def changes_since(seq=0, limit=1000, kinds=None):
+    """
+    Liest Änderungen mit einer Sequenznummer größer als `seq`.
+
+    Args:
+        seq: Zuletzt verarbeitete Sequenznummer (0 = von Anfang an)
+        limit: Maximale Anzahl Einträge
+        kinds: Optionale Auswahl an Änderungsarten
+
+    Returns:
+        Liste von Dicts (seq, event_id, kind, fields, changed_at), aufsteigend nach seq
+    """
+    query = get_supabase_client().table(CHANGES_TABLE)\
+        .select('seq,event_id,kind,fields,changed_at')\
+        .gt('seq', seq)
+    if kinds:
+        query = query.in_('kind', list(kinds))
+    return query.order('seq').limit(limit).execute().data or []
+
+
+def iter_changes_since(seq=0, batch_size=1000, kinds=None):
+    """Wie changes_since(), liest aber seitenweise alle Änderungen bis zum Ende."""
+    while True:
+        changes = changes_since(seq, limit=batch_size, kinds=kinds)
+        yield from changes
+        if len(changes) < batch_size:
+            return
+        seq = changes[-1]['seq']
+
+
+def latest_seq():
+    """Höchste vergebene Sequenznummer (0, wenn das Protokoll leer ist)."""
+    rows = get_supabase_client().table(CHANGES_TABLE)\
+        .select('seq')\
+        .order('seq', desc=True)\
+        .limit(1)\
+        .execute().data
+    return rows[0]['seq'] if rows else 0
+
+
+def main(argv=None):
+    """Hauptfunktion"""
+    parser = argparse.ArgumentParser(description='Zeigt Änderungen an Events seit einer Sequenznummer')
+    parser.add_argument('--since', type=int, default=0,
+                        help='Zuletzt verarbeitete Sequenznummer (Standard: 0)')
+    parser.add_argument('--kind', action='append', choices=CHANGE_KINDS,
+                        help='Nur diese Änderungsart(en) anzeigen')
+    args = parser.parse_args(argv)
+
+    counts = {}
+    last_seq = args.since
+    for change in iter_changes_since(args.since, kinds=args.kind):
+        counts[change['kind']] = counts.get(change['kind'], 0) + 1
+        last_seq = change['seq']
+        print(f"  #{change['seq']} {change['kind']:<8} {change['event_id']} {', '.join(sorted(change['fields']))}")
+
+    print(f"\n📊 {sum(counts.values())} Änderungen seit seq {args.since}:")
+    for kind in CHANGE_KINDS:
+        if kind in counts:
+            print(f"  • {kind}: {counts[kind]}")
+    print(f"   Nächster Aufruf: --since {last_seq}\n")
+
+
+if __name__ == '__main__':
+    main()
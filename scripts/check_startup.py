@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Prüft das Startzeit-Budget der NextFinish CLI.
+
+Misst "nextfinish.py --help" und "nextfinish.py <befehl> --help" in frischen
+Prozessen und stellt sicher, dass dabei keine schweren Abhängigkeiten geladen werden.
+Beendet sich mit Exit-Code 1, wenn das Budget überschritten wird.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+CLI = os.path.join(SCRIPTS_DIR, 'nextfinish.py')
+
+# Median-Wanduhrzeit pro Aufruf inkl. Start des Interpreters
+STARTUP_BUDGET_MS = 150
+
+# Module, die bei --help nicht geladen werden dürfen
+HEAVY_MODULES = ['supabase', 'postgrest', 'httpx', 'requests', 'bs4', 'geopy', 'faker', 'pyarrow']
+
+IMPORT_CHECK = """
+import sys
+sys.argv = ['nextfinish'] + sys.argv[1:]
+try:
+    import nextfinish
+    nextfinish.main(sys.argv[1:])
+except SystemExit:
+    pass
+heavy = {heavy!r}
+print('HEAVY_MODULES=' + ','.join(m for m in heavy if m in sys.modules))
+"""
+
+
+def measure(args, runs):
+    """Median der Laufzeit von `python nextfinish.py <args>` in Millisekunden."""
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, CLI] + args, cwd=SCRIPTS_DIR,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def loaded_heavy_modules(args):
+    """Liefert die schweren Module, die bei `nextfinish <args>` geladen wurden."""
+    result = subprocess.run(
+        [sys.executable, '-c', IMPORT_CHECK.format(heavy=HEAVY_MODULES)] + args,
+        cwd=SCRIPTS_DIR, capture_output=True, text=True, check=False,
+    )
+    for line in result.stdout.splitlines():
+        if line.startswith('HEAVY_MODULES='):
+            return [m for m in line[len('HEAVY_MODULES='):].split(',') if m]
+    return []
+
+
+def main(argv=None):
+    """Hauptfunktion"""
+    parser = argparse.ArgumentParser(description='Prüft das Startzeit-Budget der NextFinish CLI')
+    parser.add_argument('--runs', type=int, default=5, help='Messungen pro Befehl (Standard: 5)')
+    parser.add_argument('--budget-ms', type=float, default=STARTUP_BUDGET_MS,
+                        help=f'Budget in Millisekunden (Standard: {STARTUP_BUDGET_MS})')
+    args = parser.parse_args(argv)
+
+    from nextfinish import COMMANDS
+
+    cases = [['--help']] + [[command, '--help'] for command in COMMANDS]
+    failed = False
+
+    print(f"\n⏱️  Startzeit-Budget: {args.budget_ms:.0f} ms\n")
+    for case in cases:
+        label = ' '.join(case)
+        elapsed = measure(case, args.runs)
+        heavy = loaded_heavy_modules(case)
+
+        ok = elapsed <= args.budget_ms and not heavy
+        failed = failed or not ok
+        status = '✓' if ok else '✗'
+        print(f"  {status} {label:<20} {elapsed:7.1f} ms")
+        if heavy:
+            print(f"      Geladen, obwohl nicht benötigt: {', '.join(heavy)}")
+
+    if failed:
+        print("\n❌ Startzeit-Budget überschritten.\n")
+        sys.exit(1)
+    print("\n✅ Alle Befehle innerhalb des Budgets.\n")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,33 @@
+-- SQL-Skript für das Änderungsprotokoll (Change-Feed) der Events
+-- Führe dies in der SQL Editor-Konsole deines Supabase-Dashboards aus
+--
+-- Scraper (upsert_events) und Geocoder schreiben für jede Änderung eine Zeile.
+-- Downstream-Verbraucher (Caches, Exporte, Karte) lesen nur "Änderungen seit seq N"
+-- statt der ganzen Tabelle (siehe changefeed.py).
+--
+-- Hinweis: seq ist monoton steigend vergeben. Die Pipeline schreibt sequenziell,
+-- daher werden Einträge auch in seq-Reihenfolge sichtbar.
+
+CREATE TABLE IF NOT EXISTS event_changes (
+  seq BIGSERIAL PRIMARY KEY,
+  event_id UUID NOT NULL,
+  kind TEXT NOT NULL CHECK (kind IN ('insert', 'update', 'geocoded')),
+  fields JSONB NOT NULL,  -- geänderte Felder mit ihren neuen Werten
+  changed_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_event_changes_event_id ON event_changes(event_id);
+
+-- Aktiviere Row Level Security (RLS) - nur Lesen und Anhängen, kein Ändern/Löschen
+ALTER TABLE event_changes ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "Event-Änderungen sind öffentlich lesbar" ON event_changes;
+DROP POLICY IF EXISTS "Event-Änderungen können angehängt werden" ON event_changes;
+
+CREATE POLICY "Event-Änderungen sind öffentlich lesbar" ON event_changes
+  FOR SELECT
+  USING (true);
+
+CREATE POLICY "Event-Änderungen können angehängt werden" ON event_changes
+  FOR INSERT
+  WITH CHECK (true);
@@ -0,0 +1,74 @@
+-- SQL-Skript für die Archivierung vergangener Events
+-- Führe dies in der SQL Editor-Konsole deines Supabase-Dashboards aus
+--
+-- Vergangene Events werden aus `events` nach `events_archive` verschoben. Dadurch
+-- bleibt die "heiße" Tabelle klein und alle Standard-Abfragen (Startseite, Geocoder,
+-- Scraper-Upsert) kosten gleich viel, egal wie viel Historie sich ansammelt.
+--
+-- Hinweis: Range-Partitionierung auf `date` würde einen Primärschlüssel (id, date)
+-- erfordern und die Tabelle müsste neu angelegt werden. Die Archiv-Tabelle ist mit
+-- der bestehenden Tabelle und PostgREST direkt kompatibel.
+
+-- Archiv-Tabelle mit identischer Struktur (Spaltenreihenfolge muss übereinstimmen!)
+-- Wird `events` später um Spalten erweitert, müssen sie hier ebenfalls ergänzt werden.
+CREATE TABLE IF NOT EXISTS events_archive (LIKE events INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING INDEXES);
+
+-- Keyset-Pagination (utils.iter_event_batches) über created_at, id
+CREATE INDEX IF NOT EXISTS idx_events_created_at_id ON events(created_at, id);
+CREATE INDEX IF NOT EXISTS idx_events_archive_created_at_id ON events_archive(created_at, id);
+
+-- Verschiebt bis zu batch_size (max. 10000) Events mit date < heute in einem Statement.
+-- Wird vom Archiv-Job (archive_events.py) so lange aufgerufen, bis 0 zurückkommt,
+-- damit nie die ganze Tabelle auf einmal gesperrt wird.
+--
+-- Die Funktion ist mit dem öffentlichen Anon-Key aufrufbar. Das Stichtag-Datum ist
+-- deshalb bewusst KEIN Parameter: Ein Aufruf kann nur archivieren, was ohnehin
+-- vergangen ist (CURRENT_DATE auf dem Server), also genau das, was der Nacht-Job tut.
+
+-- Alte Version mit frei wählbarem Stichtag entfernen (sonst bliebe sie als Überladung bestehen)
+DROP FUNCTION IF EXISTS archive_past_events(DATE, INTEGER);
+
+CREATE OR REPLACE FUNCTION archive_past_events(batch_size INTEGER DEFAULT 1000)
+RETURNS INTEGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  moved_count INTEGER;
+BEGIN
+  WITH moved AS (
+    DELETE FROM events
+    WHERE id IN (
+      SELECT id FROM events
+      WHERE date < CURRENT_DATE
+      ORDER BY date
+      LIMIT LEAST(GREATEST(batch_size, 1), 10000)
+      FOR UPDATE SKIP LOCKED
+    )
+    RETURNING *
+  ),
+  archived AS (
+    INSERT INTO events_archive
+    SELECT * FROM moved
+    ON CONFLICT (id) DO NOTHING
+  )
+  SELECT COUNT(*) INTO moved_count FROM moved;
+
+  RETURN moved_count;
+END $$;
+
+-- Gesamtsicht für Analysen und Exporte (aktuelle + archivierte Events)
+CREATE OR REPLACE VIEW events_all AS
+  SELECT * FROM events
+  UNION ALL
+  SELECT * FROM events_archive;
+
+-- Aktiviere Row Level Security (RLS) - erlaubt öffentliche Lesezugriffe
+ALTER TABLE events_archive ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "Archivierte Events sind öffentlich lesbar" ON events_archive;
+
+CREATE POLICY "Archivierte Events sind öffentlich lesbar" ON events_archive
+  FOR SELECT
+  USING (true);
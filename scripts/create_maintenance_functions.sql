@@ -0,0 +1,170 @@
+-- SQL-Skript für mengenbasierte Wartungs-Operationen auf der Events-Tabelle
+-- Führe dies in der SQL Editor-Konsole deines Supabase-Dashboards aus
+--
+-- Jede Operation läuft serverseitig als ein einziges Statement pro Block und gibt
+-- nur Zähler zurück, nie Event-Daten. Gearbeitet wird in id-Bereichen:
+-- Ein Aufruf bearbeitet höchstens p_chunk_size Zeilen mit id > p_after und liefert
+-- die letzte bearbeitete id zurück. maintenance.py ruft die Funktionen so lange auf,
+-- bis last_id NULL ist - große Resets sperren die Tabelle also nie am Stück.
+--
+-- Mit p_dry_run = TRUE wird nur gezählt. p_chunk_size wird auf 1..10000 begrenzt,
+-- damit auch ein Aufruf mit riesigem Wert nie die ganze Tabelle in einem Statement sperrt.
+--
+-- Hinweis: Die Funktionen laufen mit SECURITY INVOKER, also mit den Rechten und
+-- RLS-Policies des Aufrufers (für Schreibzugriffe gilt die UPDATE-Policy auf `events`).
+
+-- Obergrenze (höchste id) des nächsten Blocks nach p_after (max. 10000 Zeilen)
+CREATE OR REPLACE FUNCTION maint_chunk_upper(p_after UUID, p_chunk_size INTEGER)
+RETURNS UUID
+LANGUAGE sql
+STABLE
+SECURITY INVOKER
+SET search_path = public
+AS $$
+  SELECT MAX(id) FROM (
+    SELECT id FROM events
+    WHERE p_after IS NULL OR id > p_after
+    ORDER BY id
+    LIMIT LEAST(GREATEST(p_chunk_size, 1), 10000)
+  ) chunk;
+$$;
+
+-- Geodaten zurücksetzen, damit der Geocoder die Events neu verarbeitet.
+-- Filter: location und/oder city (mindestens einer muss gesetzt sein)
+CREATE OR REPLACE FUNCTION maint_regeocode(
+  p_location TEXT DEFAULT NULL,
+  p_city TEXT DEFAULT NULL,
+  p_after UUID DEFAULT NULL,
+  p_chunk_size INTEGER DEFAULT 5000,
+  p_dry_run BOOLEAN DEFAULT FALSE
+)
+RETURNS TABLE (affected BIGINT, last_id UUID)
+LANGUAGE plpgsql
+SECURITY INVOKER
+SET search_path = public
+AS $$
+DECLARE
+  v_upper UUID;
+  v_affected BIGINT;
+BEGIN
+  IF p_location IS NULL AND p_city IS NULL THEN
+    RAISE EXCEPTION 'maint_regeocode: p_location oder p_city muss gesetzt sein';
+  END IF;
+
+  v_upper := maint_chunk_upper(p_after, p_chunk_size);
+  IF v_upper IS NULL THEN
+    RETURN QUERY SELECT 0::BIGINT, NULL::UUID;
+    RETURN;
+  END IF;
+
+  IF p_dry_run THEN
+    SELECT COUNT(*) INTO v_affected FROM events e
+    WHERE (p_after IS NULL OR e.id > p_after) AND e.id <= v_upper
+      AND (p_location IS NULL OR e.location = p_location)
+      AND (p_city IS NULL OR e.city = p_city);
+  ELSE
+    UPDATE events e
+    SET lat = NULL, lng = NULL, city = NULL, location = NULL, raw_location_data = NULL
+    WHERE (p_after IS NULL OR e.id > p_after) AND e.id <= v_upper
+      AND (p_location IS NULL OR e.location = p_location)
+      AND (p_city IS NULL OR e.city = p_city);
+    GET DIAGNOSTICS v_affected = ROW_COUNT;
+  END IF;
+
+  RETURN QUERY SELECT v_affected, v_upper;
+END $$;
+
+-- Koordinaten innerhalb einer Bounding Box löschen
+CREATE OR REPLACE FUNCTION maint_clear_coords_bbox(
+  p_min_lat NUMERIC,
+  p_max_lat NUMERIC,
+  p_min_lng NUMERIC,
+  p_max_lng NUMERIC,
+  p_after UUID DEFAULT NULL,
+  p_chunk_size INTEGER DEFAULT 5000,
+  p_dry_run BOOLEAN DEFAULT FALSE
+)
+RETURNS TABLE (affected BIGINT, last_id UUID)
+LANGUAGE plpgsql
+SECURITY INVOKER
+SET search_path = public
+AS $$
+DECLARE
+  v_upper UUID;
+  v_affected BIGINT;
+BEGIN
+  v_upper := maint_chunk_upper(p_after, p_chunk_size);
+  IF v_upper IS NULL THEN
+    RETURN QUERY SELECT 0::BIGINT, NULL::UUID;
+    RETURN;
+  END IF;
+
+  IF p_dry_run THEN
+    SELECT COUNT(*) INTO v_affected FROM events e
+    WHERE (p_after IS NULL OR e.id > p_after) AND e.id <= v_upper
+      AND e.lat BETWEEN p_min_lat AND p_max_lat
+      AND e.lng BETWEEN p_min_lng AND p_max_lng;
+  ELSE
+    UPDATE events e
+    SET lat = NULL, lng = NULL
+    WHERE (p_after IS NULL OR e.id > p_after) AND e.id <= v_upper
+      AND e.lat BETWEEN p_min_lat AND p_max_lat
+      AND e.lng BETWEEN p_min_lng AND p_max_lng;
+    GET DIAGNOSTICS v_affected = ROW_COUNT;
+  END IF;
+
+  RETURN QUERY SELECT v_affected, v_upper;
+END $$;
+
+-- city aus raw_location_data neu berechnen (gleiche Priorität wie geocode_events.py)
+CREATE OR REPLACE FUNCTION maint_recompute_city(
+  p_after UUID DEFAULT NULL,
+  p_chunk_size INTEGER DEFAULT 5000,
+  p_dry_run BOOLEAN DEFAULT FALSE
+)
+RETURNS TABLE (affected BIGINT, last_id UUID)
+LANGUAGE plpgsql
+SECURITY INVOKER
+SET search_path = public
+AS $$
+DECLARE
+  v_upper UUID;
+  v_affected BIGINT;
+BEGIN
+  v_upper := maint_chunk_upper(p_after, p_chunk_size);
+  IF v_upper IS NULL THEN
+    RETURN QUERY SELECT 0::BIGINT, NULL::UUID;
+    RETURN;
+  END IF;
+
+  IF p_dry_run THEN
+    SELECT COUNT(*) INTO v_affected FROM events e
+    WHERE (p_after IS NULL OR e.id > p_after) AND e.id <= v_upper
+      AND e.raw_location_data IS NOT NULL
+      AND e.city IS DISTINCT FROM COALESCE(
+        e.raw_location_data->'address'->>'city',
+        e.raw_location_data->'address'->>'town',
+        e.raw_location_data->'address'->>'state',
+        e.raw_location_data->'address'->>'village'
+      );
+  ELSE
+    UPDATE events e
+    SET city = COALESCE(
+      e.raw_location_data->'address'->>'city',
+      e.raw_location_data->'address'->>'town',
+      e.raw_location_data->'address'->>'state',
+      e.raw_location_data->'address'->>'village'
+    )
+    WHERE (p_after IS NULL OR e.id > p_after) AND e.id <= v_upper
+      AND e.raw_location_data IS NOT NULL
+      AND e.city IS DISTINCT FROM COALESCE(
+        e.raw_location_data->'address'->>'city',
+        e.raw_location_data->'address'->>'town',
+        e.raw_location_data->'address'->>'state',
+        e.raw_location_data->'address'->>'village'
+      );
+    GET DIAGNOSTICS v_affected = ROW_COUNT;
+  END IF;
+
+  RETURN QUERY SELECT v_affected, v_upper;
+END $$;
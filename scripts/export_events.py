@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+"""
+Export der Events-Tabelle in spaltenorientierte Snapshots für Offline-Analysen.
+
+Die Events werden seitenweise gelesen und nach Monat (Spalte `date`) partitioniert
+geschrieben:
+
+    <out>/month=2025-04/part-20251019T040000123456-1a2b3c4d.parquet
+    <out>/month=2025-05/part-20251019T040000123456-1a2b3c4d.parquet
+    <out>/_state.json
+
+Formate:
+    parquet  - komprimiert, ideal für Pandas/DuckDB/Polars (benötigt pyarrow)
+    arrow    - Arrow-IPC, unkomprimiert und direkt per Memory-Map lesbar (benötigt pyarrow)
+    ndjson   - gzip-komprimiertes NDJSON, ohne zusätzliche Abhängigkeiten
+
+Mit --table events_all werden auch archivierte Events exportiert
+(siehe create_events_archive.sql).
+
+Existiert bereits ein Snapshot, werden nur Events angehängt, die nach dem letzten
+exportierten (created_at, id) angelegt wurden. Mit --full wird neu aufgebaut.
+
+Beispiel:
+    python export_events.py --format parquet --out exports/events
+"""
+
+import argparse
+import gzip
+import json
+import os
+import secrets
+import shutil
+from datetime import date, datetime, timezone
+from utils import get_supabase_client, iter_event_batches
+
+STATE_FILE = '_state.json'
+
+FORMAT_EXTENSIONS = {
+    'parquet': '.parquet',
+    'arrow': '.arrow',
+    'ndjson': '.ndjson.gz',
+}
+
+# Spalten der events-Tabelle (siehe frontend/types/database.ts) mit Arrow-Typ
+EXPORT_COLUMNS = [
+    ('id', 'string'),
+    ('name', 'string'),
+    ('title', 'string'),
+    ('description', 'string'),
+    ('category', 'string'),
+    ('type', 'string'),
+    ('location', 'string'),
+    ('city', 'string'),
+    ('date', 'date32'),
+    ('distance', 'float64'),
+    ('price', 'int64'),
+    ('capacity', 'int64'),
+    ('image_url', 'string'),
+    ('link', 'string'),
+    ('lat', 'float64'),
+    ('lng', 'float64'),
+    ('raw_location_data', 'string'),  # JSON-String
+    ('created_at', 'string'),         # ISO-Zeitstempel wie von PostgREST geliefert
+]
+
+
+def _import_pyarrow():
+    """Importiert pyarrow erst bei Bedarf (optionale Abhängigkeit)."""
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError:
+        raise SystemExit('pyarrow ist nicht installiert. Installiere es mit '
+                         '"pip install pyarrow" oder nutze --format ndjson.')
+    return pyarrow
+
+
+def _arrow_schema(pa):
+    return pa.schema([(name, getattr(pa, type_name)()) for name, type_name in EXPORT_COLUMNS])
+
+
+def _partition_key(row):
+    """Monat des Events als Partitionsschlüssel (YYYY-MM)."""
+    event_date = row.get('date')
+    if not event_date:
+        return 'unknown'
+    return str(event_date)[:7]
+
+
+def _normalize_row(row):
+    """Bringt eine Zeile aus PostgREST in die Typen des Export-Schemas."""
+    normalized = {name: row.get(name) for name, _ in EXPORT_COLUMNS}
+
+    if normalized['date']:
+        normalized['date'] = date.fromisoformat(str(normalized['date'])[:10])
+    for key in ('distance', 'lat', 'lng'):
+        if normalized[key] is not None:
+            normalized[key] = float(normalized[key])
+    if normalized['raw_location_data'] is not None and not isinstance(normalized['raw_location_data'], str):
+        normalized['raw_location_data'] = json.dumps(normalized['raw_location_data'], ensure_ascii=False)
+
+    return normalized
+
+
+# Endung für Part-Dateien, solange der Lauf nicht abgeschlossen ist (vom Loader ignoriert)
+TMP_SUFFIX = '.tmp'
+
+
+def new_run_id():
+    """Eindeutige Lauf-ID (Mikrosekunden plus Zufallsanteil)."""
+    return f"{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S%f')}-{secrets.token_hex(4)}"
+
+
+class PartitionWriter:
+    """
+    Hält pro Monat eine offene Datei und schreibt Batches inkrementell hinein.
+
+    Die Dateien werden unter einem temporären Namen geschrieben und erst mit
+    commit() sichtbar; discard() entfernt sie nach einem Fehler wieder.
+    """
+
+    def __init__(self, out_dir, fmt, run_id):
+        self.out_dir = out_dir
+        self.fmt = fmt
+        self.run_id = run_id
+        self.writers = {}
+        self.paths = []
+        self.rows_written = 0
+        if fmt in ('parquet', 'arrow'):
+            self.pa = _import_pyarrow()
+            self.schema = _arrow_schema(self.pa)
+
+    def _open(self, month):
+        partition_dir = os.path.join(self.out_dir, f'month={month}')
+        os.makedirs(partition_dir, exist_ok=True)
+        path = os.path.join(partition_dir, f'part-{self.run_id}{FORMAT_EXTENSIONS[self.fmt]}')
+        tmp_path = path + TMP_SUFFIX
+
+        # Exklusiv anlegen: eine bestehende Datei wird nie überschrieben
+        open(tmp_path, 'xb').close()
+        self.paths.append(path)
+
+        if self.fmt == 'parquet':
+            return self.pa.parquet.ParquetWriter(tmp_path, self.schema, compression='zstd')
+        if self.fmt == 'arrow':
+            return self.pa.ipc.new_file(tmp_path, self.schema)
+        return gzip.open(tmp_path, 'wt', encoding='utf-8')
+
+    def write(self, rows):
+        partitions = {}
+        for row in rows:
+            partitions.setdefault(_partition_key(row), []).append(row)
+
+        for month, month_rows in partitions.items():
+            writer = self.writers.get(month)
+            if writer is None:
+                writer = self.writers[month] = self._open(month)
+
+            if self.fmt == 'ndjson':
+                for row in month_rows:
+                    writer.write(json.dumps(row, ensure_ascii=False, default=str))
+                    writer.write('\n')
+            else:
+                table = self.pa.Table.from_pylist([_normalize_row(r) for r in month_rows], schema=self.schema)
+                writer.write_table(table)
+
+            self.rows_written += len(month_rows)
+
+    def close(self):
+        for writer in self.writers.values():
+            writer.close()
+        self.writers = {}
+
+    def commit(self):
+        """Macht die geschriebenen Dateien für den Loader sichtbar."""
+        self.close()
+        for path in self.paths:
+            os.replace(path + TMP_SUFFIX, path)
+        self.paths = []
+
+    def discard(self):
+        """Entfernt alle Dateien dieses Laufs (nach einem Fehler)."""
+        try:
+            self.close()
+        finally:
+            for path in self.paths:
+                if os.path.exists(path + TMP_SUFFIX):
+                    os.remove(path + TMP_SUFFIX)
+            self.paths = []
+
+
+def read_state(out_dir):
+    path = os.path.join(out_dir, STATE_FILE)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_state(out_dir, state):
+    path = os.path.join(out_dir, STATE_FILE)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _is_snapshot_entry(entry):
+    """True für Einträge, die der Export selbst anlegt (Partitionen und Zustand)."""
+    return entry.startswith('month=') or entry == STATE_FILE
+
+
+def finalize_pending_parts(out_dir, run_id):
+    """
+    Räumt Part-Dateien auf, die ein abgebrochener Lauf als .tmp hinterlassen hat.
+
+    Gehören sie zum Lauf aus _state.json, war der Cursor bereits gespeichert; sie
+    werden nachträglich sichtbar gemacht. Alle anderen stammen aus Läufen ohne
+    gespeicherten Zustand und werden gelöscht.
+
+    Returns:
+        Anzahl nachträglich übernommener Dateien
+    """
+    finalized = 0
+    for entry in os.listdir(out_dir):
+        partition_dir = os.path.join(out_dir, entry)
+        if not entry.startswith('month=') or not os.path.isdir(partition_dir):
+            continue
+        for name in os.listdir(partition_dir):
+            if not name.endswith(TMP_SUFFIX):
+                continue
+            path = os.path.join(partition_dir, name)
+            if run_id and name.startswith(f'part-{run_id}.'):
+                os.replace(path, path[:-len(TMP_SUFFIX)])
+                finalized += 1
+            else:
+                os.remove(path)
+    return finalized
+
+
+def swap_snapshot(build_dir, out_dir):
+    """
+    Ersetzt den Snapshot in out_dir durch den fertig aufgebauten in build_dir.
+
+    Dateien in out_dir, die nicht vom Export stammen, bleiben erhalten.
+    """
+    if not os.path.isdir(out_dir):
+        os.rename(build_dir, out_dir)
+        return
+
+    old_dir = build_dir + '.old'
+    os.rename(out_dir, old_dir)
+    os.rename(build_dir, out_dir)
+    for entry in os.listdir(old_dir):
+        if not _is_snapshot_entry(entry):
+            os.replace(os.path.join(old_dir, entry), os.path.join(out_dir, entry))
+    shutil.rmtree(old_dir)
+
+
+def export_events(out_dir, fmt='parquet', batch_size=1000, full=False, table='events'):
+    """
+    Exportiert die Events-Tabelle (bzw. neue Events seit dem letzten Lauf).
+
+    Ein vollständiger Export (--full) wird in einem Nachbarverzeichnis aufgebaut und
+    erst nach Erfolg gegen den bestehenden Snapshot getauscht. Schlägt er fehl,
+    bleibt der alte Snapshot unverändert.
+
+    Returns:
+        Anzahl exportierter Zeilen
+    """
+    out_dir = os.path.normpath(out_dir)
+    if full:
+        print("📦 Vollständiger Export")
+        run_id = new_run_id()
+        build_dir = f'{out_dir}.full-{run_id}'
+        try:
+            rows = _export_run(build_dir, fmt, batch_size, table, None, run_id)
+        except BaseException:
+            shutil.rmtree(build_dir, ignore_errors=True)
+            raise
+        swap_snapshot(build_dir, out_dir)
+        return rows
+
+    state = read_state(out_dir)
+    if state and state.get('format') != fmt:
+        raise SystemExit(f"Snapshot in {out_dir} hat Format '{state.get('format')}', "
+                         f"angefordert wurde '{fmt}'. Nutze --full zum Neuaufbau.")
+    if state and state.get('table', 'events') != table:
+        raise SystemExit(f"Snapshot in {out_dir} stammt aus '{state.get('table', 'events')}', "
+                         f"angefordert wurde '{table}'. Nutze --full zum Neuaufbau.")
+
+    if state:
+        finalized = finalize_pending_parts(out_dir, state.get('run_id'))
+        if finalized:
+            print(f"  ✓ {finalized} Part-Dateien des letzten Laufs nachträglich übernommen")
+
+    if state and state.get('cursor'):
+        print(f"➕ Inkrementeller Export ab created_at={state['cursor'][0]}")
+    else:
+        print("📦 Vollständiger Export")
+
+    return _export_run(out_dir, fmt, batch_size, table, state, new_run_id())
+
+
+def _export_run(out_dir, fmt, batch_size, table, state, run_id):
+    """Exportiert alle Events nach dem Cursor aus `state` als ein Lauf mit run_id."""
+    cursor = tuple(state['cursor']) if state and state.get('cursor') else None
+
+    os.makedirs(out_dir, exist_ok=True)
+    supabase = get_supabase_client()
+    writer = PartitionWriter(out_dir, fmt, run_id)
+
+    # Part-Dateien werden erst nach dem Speichern des Cursors sichtbar. Bricht der
+    # Lauf vorher ab, wird alles verworfen und der nächste Lauf beginnt am alten
+    # Cursor. Bricht er danach ab, erkennt der nächste Lauf die .tmp-Dateien an der
+    # run_id im Zustand und übernimmt sie (finalize_pending_parts).
+    try:
+        for batch in iter_event_batches(supabase, batch_size=batch_size, after=cursor,
+                                        table=table, upcoming=False):
+            writer.write(batch)
+            cursor = (batch[-1]['created_at'], batch[-1]['id'])
+            print(f"  ✓ {writer.rows_written} Events exportiert...")
+        writer.close()
+
+        write_state(out_dir, {
+            'format': fmt,
+            'table': table,
+            'cursor': list(cursor) if cursor else None,
+            'rows': (state or {}).get('rows', 0) + writer.rows_written,
+            'run_id': run_id,
+            'updated_at': datetime.now(timezone.utc).isoformat(),
+        })
+    except BaseException:
+        writer.discard()
+        raise
+
+    writer.commit()
+    return writer.rows_written
+
+
+def _snapshot_files(snapshot_dir, fmt, months=None):
+    extension = FORMAT_EXTENSIONS[fmt]
+    files = []
+    for entry in sorted(os.listdir(snapshot_dir)):
+        if not entry.startswith('month='):
+            continue
+        if months and entry[len('month='):] not in months:
+            continue
+        partition_dir = os.path.join(snapshot_dir, entry)
+        files.extend(
+            os.path.join(partition_dir, name)
+            for name in sorted(os.listdir(partition_dir))
+            if name.endswith(extension)
+        )
+    return files
+
+
+def load_events_snapshot(snapshot_dir, months=None, columns=None):
+    """
+    Lädt einen Snapshot zur Analyse, ohne die Datenbank anzufassen.
+
+    Arrow- und Parquet-Dateien werden per Memory-Map geöffnet; bei Arrow-IPC
+    entsteht dabei keine Kopie der Daten im Speicher.
+
+    Args:
+        snapshot_dir: Verzeichnis des Exports
+        months: Optionale Liste von Monaten ('YYYY-MM'), die geladen werden sollen
+        columns: Optionale Spaltenauswahl
+
+    Returns:
+        pyarrow.Table (parquet/arrow) bzw. Generator von Dicts (ndjson)
+    """
+    state = read_state(snapshot_dir)
+    if not state:
+        raise FileNotFoundError(f'Kein Snapshot in {snapshot_dir} gefunden')
+
+    fmt = state['format']
+    files = _snapshot_files(snapshot_dir, fmt, months)
+
+    if fmt == 'ndjson':
+        return _iter_ndjson(files, columns)
+
+    pa = _import_pyarrow()
+    if fmt == 'parquet':
+        tables = [pa.parquet.read_table(path, columns=columns, memory_map=True) for path in files]
+    else:
+        tables = []
+        for path in files:
+            table = pa.ipc.open_file(pa.memory_map(path, 'r')).read_all()
+            tables.append(table.select(columns) if columns else table)
+
+    if not tables:
+        schema = _arrow_schema(pa)
+        empty = schema.empty_table()
+        return empty.select(columns) if columns else empty
+    return pa.concat_tables(tables)
+
+
+def _iter_ndjson(files, columns=None):
+    for path in files:
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            for line in f:
+                row = json.loads(line)
+                yield {c: row.get(c) for c in columns} if columns else row
+
+
+def main(argv=None):
+    """Hauptfunktion"""
+    parser = argparse.ArgumentParser(description='Exportiert die Events-Tabelle als Snapshot')
+    parser.add_argument('--out', default=os.path.join('exports', 'events'),
+                        help='Zielverzeichnis (Standard: exports/events)')
+    parser.add_argument('--format', choices=sorted(FORMAT_EXTENSIONS), default='parquet',
+                        help='Dateiformat (Standard: parquet)')
+    parser.add_argument('--batch-size', type=int, default=1000,
+                        help='Zeilen pro Datenbank-Anfrage (Standard: 1000)')
+    parser.add_argument('--table', choices=['events', 'events_all'], default='events',
+                        help='Quelle: nur aktuelle Events oder inkl. Archiv (Standard: events)')
+    parser.add_argument('--full', action='store_true',
+                        help='Snapshot komplett neu aufbauen statt anzuhängen')
+    args = parser.parse_args(argv)
+
+    print("\n🚀 Starte Export der Events...\n")
+    count = export_events(args.out, fmt=args.format, batch_size=args.batch_size,
+                          full=args.full, table=args.table)
+    print(f"\n✅ Fertig! {count} Events nach {args.out} exportiert.\n")
+
+
+if __name__ == '__main__':
+    main()
@@ -4,20 +4,32 @@ Geocoding-Skript: Findet Koordinaten für Events ohne Location-Daten
 Nutzt Nominatim (OpenStreetMap) API
 """
 
-import time
-from geopy.geocoders import Nominatim
-from geopy.exc import GeocoderTimedOut
-from utils import get_supabase_client
+import argparse
+from datetime import date
+from changefeed import ChangeLog
+from utils import get_supabase_client, get_rate_controller, MAX_THROTTLE_RETRIES
 
-# Setup
-supabase = get_supabase_client()
-geolocator = Nominatim(user_agent="nextfinish_scraper_v1")
+NOMINATIM_HOST = 'nominatim.openstreetmap.org'
+
+
+def geocode_missing_events(dry_run=False):
+    # geopy erst hier laden, damit z.B. "--help" ohne die Abhängigkeit auskommt
+    from geopy.geocoders import Nominatim
+    from geopy.exc import GeocoderRateLimited, GeocoderServiceError, GeocoderUnavailable
+
+    supabase = get_supabase_client()
+    geolocator = Nominatim(user_agent="nextfinish_scraper_v1")
+    rate_controller = get_rate_controller()
+    change_log = ChangeLog(supabase)
 
-def geocode_missing_events():
     print("🌍 Starte Geocoding für Events ohne Koordinaten...")
     
-    # 1. Hole alle Events, die noch keine Koordinaten haben (lat is NULL)
-    response = supabase.table('events').select("*").is_('lat', 'null').execute()
+    # 1. Hole alle kommenden Events, die noch keine Koordinaten haben (lat is NULL)
+    #    Vergangene Events brauchen keine Geodaten mehr und werden archiviert
+    response = supabase.table('events').select("*")\
+        .is_('lat', 'null')\
+        .gte('date', date.today().isoformat())\
+        .execute()
     events_to_process = response.data
     
     print(f"   Gefunden: {len(events_to_process)} Events ohne Ort.")
@@ -25,6 +37,10 @@ def geocode_missing_events():
     if len(events_to_process) == 0:
         print("   ✓ Alle Events haben bereits Koordinaten.")
         return
+
+    if dry_run:
+        print("   (Dry-Run: keine Anfragen an Nominatim, keine Änderungen)")
+        return
     
     count = 0
     for event in events_to_process:
@@ -82,21 +98,43 @@ def geocode_missing_events():
             if len(query) < 3: 
                 continue
             
-            try:
-                # Rate Limit
-                time.sleep(1.1) 
-                
-                # Fokus auf DACH-Region (viewbox ist optional, aber 'countrycodes' hilft)
-                # Wir suchen global, aber bevorzugen deutschsprachige Ergebnisse
-                location = geolocator.geocode(query, language="de", addressdetails=True)
-                
-                if location:
-                    print(f"   ✅ Gefunden via '{query}': {location.address}")
-                    break 
-                else:
-                    print(f"   ❌ Nicht gefunden via '{query}'")
-            except Exception as e:
-                print(f"   ⚠️ Fehler bei Anfrage '{query}': {e}")
+            # Gedrosselte Anfragen (429/503) werden nach der Pause mit derselben Query wiederholt
+            for attempt in range(MAX_THROTTLE_RETRIES + 1):
+                # Rate Limit (max. 1 Anfrage/s laut Nominatim, länger nach Fehlern)
+                rate_controller.wait(NOMINATIM_HOST)
+                throttled = False
+
+                try:
+                    # Fokus auf DACH-Region (viewbox ist optional, aber 'countrycodes' hilft)
+                    # Wir suchen global, aber bevorzugen deutschsprachige Ergebnisse
+                    location = geolocator.geocode(query, language="de", addressdetails=True)
+                    rate_controller.record(NOMINATIM_HOST, status=200)
+
+                    if location:
+                        print(f"   ✅ Gefunden via '{query}': {location.address}")
+                    else:
+                        print(f"   ❌ Nicht gefunden via '{query}'")
+                except GeocoderRateLimited as e:
+                    rate_controller.record(NOMINATIM_HOST, status=429, retry_after=e.retry_after)
+                    throttled = True
+                    print(f"   ⚠️ Rate Limit bei Anfrage '{query}': {e}")
+                except GeocoderUnavailable as e:
+                    rate_controller.record(NOMINATIM_HOST, status=503)
+                    throttled = True
+                    print(f"   ⚠️ Dienst nicht verfügbar bei Anfrage '{query}': {e}")
+                except GeocoderServiceError as e:
+                    rate_controller.record(NOMINATIM_HOST, error=True)
+                    print(f"   ⚠️ Fehler bei Anfrage '{query}': {e}")
+                except Exception as e:
+                    print(f"   ⚠️ Fehler bei Anfrage '{query}': {e}")
+
+                if not throttled:
+                    break
+                if attempt < MAX_THROTTLE_RETRIES:
+                    print(f"   ⏳ Neuer Versuch {attempt + 1}/{MAX_THROTTLE_RETRIES} für '{query}'...")
+
+            if location:
+                break
         
         # Update in Datenbank
         if location:
@@ -119,6 +157,10 @@ def geocode_missing_events():
                 result = supabase.table('events').update(update_data).eq('id', event_id).execute()
                 if result.data and len(result.data) > 0:
                     count += 1
+                    # raw_location_data bleibt im Change-Feed außen vor (groß, nur Rohdaten)
+                    change_log.record('geocoded', event_id, {
+                        key: value for key, value in update_data.items() if key != 'raw_location_data'
+                    })
                 else:
                     print(f"   ⚠️  Warnung: Update für Event {event_id} - keine Daten zurückgegeben")
             except Exception as e:
@@ -128,8 +170,22 @@ def geocode_missing_events():
             print("   🏳️  Aufgegeben. Kein Ort gefunden.")
             # Optional: Markieren, damit wir nicht immer wieder suchen (z.B. lat=0 setzen)
 
+        # Außerhalb des try: Change-Feed-Probleme zählen nicht als Update-Fehler
+        change_log.flush_if_full()
+
     print(f"\n🏁 Fertig. {count}/{len(events_to_process)} Events geocodiert.")
+    change_log.flush()
+    rate_controller.report()
+
+def main(argv=None):
+    """Hauptfunktion"""
+    parser = argparse.ArgumentParser(description='Findet Koordinaten für Events ohne Location-Daten')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='Nur zählen, nichts geocodieren oder schreiben')
+    args = parser.parse_args(argv)
+
+    geocode_missing_events(dry_run=args.dry_run)
 
 if __name__ == "__main__":
-    geocode_missing_events()
+    main()
 
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Wartungs-Operationen für die Events-Tabelle.
+
+Alle Operationen laufen serverseitig (RPC, siehe create_maintenance_functions.sql)
+als ein Statement pro id-Block und liefern nur Zähler zurück. Mit --dry-run wird
+nur gezählt, wie viele Events betroffen wären.
+
+Beispiele:
+    python maintenance.py regeocode --location Deutschland --dry-run
+    python maintenance.py clear-coords-bbox --min-lat 47 --max-lat 55 --min-lng 5 --max-lng 15
+    python maintenance.py recompute-city
+"""
+
+import argparse
+from utils import get_supabase_client
+
+DEFAULT_CHUNK_SIZE = 5000
+# Obergrenze pro Statement, wird auch serverseitig erzwungen
+MAX_CHUNK_SIZE = 10000
+
+# Operation -> RPC-Funktion, Parameter (CLI-Name -> Typ) und Beschreibung
+OPERATIONS = {
+    'regeocode': {
+        'rpc': 'maint_regeocode',
+        'params': {'location': str, 'city': str},
+        'help': 'Geodaten zurücksetzen, damit der Geocoder die Events neu verarbeitet',
+    },
+    'clear-coords-bbox': {
+        'rpc': 'maint_clear_coords_bbox',
+        'params': {'min_lat': float, 'max_lat': float, 'min_lng': float, 'max_lng': float},
+        'required': True,
+        'help': 'Koordinaten aller Events innerhalb einer Bounding Box löschen',
+    },
+    'recompute-city': {
+        'rpc': 'maint_recompute_city',
+        'params': {},
+        'help': 'city aus raw_location_data neu berechnen',
+    },
+}
+
+
+def run_operation(name, params=None, chunk_size=DEFAULT_CHUNK_SIZE, dry_run=False):
+    """
+    Führt eine Wartungs-Operation blockweise über die ganze Tabelle aus.
+
+    Args:
+        name: Name der Operation (Schlüssel in OPERATIONS)
+        params: Filter-Parameter der Operation (ohne 'p_'-Präfix)
+        chunk_size: Maximale Anzahl Zeilen pro Statement
+        dry_run: Nur zählen, nichts ändern
+
+    Returns:
+        Anzahl betroffener Events
+    """
+    operation = OPERATIONS[name]
+    rpc_params = {f'p_{key}': value for key, value in (params or {}).items() if value is not None}
+    rpc_params['p_chunk_size'] = max(1, min(chunk_size, MAX_CHUNK_SIZE))
+    rpc_params['p_dry_run'] = dry_run
+
+    supabase = get_supabase_client()
+    total_affected = 0
+    after = None
+    chunks = 0
+
+    while True:
+        rpc_params['p_after'] = after
+        response = supabase.rpc(operation['rpc'], rpc_params).execute()
+        result = response.data[0] if response.data else {'affected': 0, 'last_id': None}
+
+        total_affected += result['affected'] or 0
+        after = result['last_id']
+        if after is None:
+            return total_affected
+
+        chunks += 1
+        if chunks % 10 == 0:
+            print(f"  ✓ {chunks} Blöcke verarbeitet, {total_affected} Events betroffen...")
+
+
+def main(argv=None):
+    """Hauptfunktion"""
+    parser = argparse.ArgumentParser(description='Wartungs-Operationen für die Events-Tabelle')
+    subparsers = parser.add_subparsers(dest='operation', metavar='<operation>')
+    subparsers.required = True
+
+    for name, operation in OPERATIONS.items():
+        sub = subparsers.add_parser(name, help=operation['help'], description=operation['help'])
+        for param, param_type in operation['params'].items():
+            sub.add_argument(f"--{param.replace('_', '-')}", dest=param, type=param_type,
+                             required=operation.get('required', False))
+        sub.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                         help=f'Maximale Zeilen pro Statement (Standard: {DEFAULT_CHUNK_SIZE}, max. {MAX_CHUNK_SIZE})')
+        sub.add_argument('--dry-run', action='store_true', help='Nur zählen, nichts ändern')
+
+    args = parser.parse_args(argv)
+    operation = OPERATIONS[args.operation]
+    params = {param: getattr(args, param) for param in operation['params']}
+
+    if operation['params'] and all(value is None for value in params.values()):
+        parser.error(f"{args.operation}: mindestens ein Filter muss angegeben werden")
+
+    print(f"\n🔧 Wartung: {args.operation}{' (Dry-Run)' if args.dry_run else ''}\n")
+    count = run_operation(args.operation, params, chunk_size=args.chunk_size, dry_run=args.dry_run)
+
+    if args.dry_run:
+        print(f"🔎 {count} Events wären betroffen.\n")
+    else:
+        print(f"✅ {count} Events aktualisiert.\n")
+
+
+if __name__ == '__main__':
+    main()
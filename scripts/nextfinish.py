@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+NextFinish CLI: Ein Einstiegspunkt für alle Pipeline-Skripte.
+
+    python nextfinish.py scrape [--dry-run]
+    python nextfinish.py geocode [--dry-run]
+    python nextfinish.py stats
+    python nextfinish.py <befehl> --help
+
+Die Skripte werden erst geladen, wenn ihr Befehl ausgeführt wird. Schwere
+Abhängigkeiten (supabase, bs4, geopy, pyarrow) importieren die Skripte ihrerseits
+erst bei Bedarf, und die Datenbank-Verbindung entsteht beim ersten Zugriff.
+"""
+
+import argparse
+import importlib
+import sys
+
+# Befehl -> (Modul, Beschreibung)
+COMMANDS = {
+    'scrape': ('scrape_marathon_de', 'Marathon-Events von marathon.de scrapen und importieren'),
+    'geocode': ('geocode_events', 'Koordinaten für Events ohne Location-Daten ermitteln'),
+    'seed': ('seed_events', 'Datenbank mit Test-Events befüllen (löscht vorhandene Events!)'),
+    'stats': ('debug_db_data', 'Statistik über Events und Geodaten anzeigen'),
+    'reset': ('reset_germany_locations', '"Deutschland"-Locations für erneutes Geocoding zurücksetzen'),
+    'maint': ('maintenance', 'Mengenbasierte Wartungs-Operationen (regeocode, clear-coords-bbox, ...)'),
+    'changes': ('changefeed', 'Änderungen an Events seit einer Sequenznummer anzeigen'),
+    'archive': ('archive_events', 'Vergangene Events ins Archiv verschieben'),
+    'export': ('export_events', 'Events als Parquet/Arrow/NDJSON-Snapshot exportieren'),
+    'feed': ('build_static_feed', 'Statische Event-Feeds für das Frontend erzeugen'),
+}
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='nextfinish',
+        description='NextFinish Daten-Pipeline',
+        epilog='Hilfe zu einem Befehl: nextfinish <befehl> --help',
+    )
+    subparsers = parser.add_subparsers(dest='command', metavar='<befehl>')
+    subparsers.required = True
+    for name, (_, help_text) in COMMANDS.items():
+        # Argumente (inkl. --help) werden an das jeweilige Skript weitergereicht
+        subparsers.add_parser(name, help=help_text, add_help=False)
+    return parser
+
+
+def main(argv=None):
+    """Hauptfunktion"""
+    parser = build_parser()
+    args, command_argv = parser.parse_known_args(argv)
+
+    module_name = COMMANDS[args.command][0]
+    module = importlib.import_module(module_name)
+
+    sys.argv[0] = f'nextfinish {args.command}'
+    module.main(command_argv)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,21 +1,35 @@
 #!/usr/bin/env python3
 """
-Einmaliges Skript: Setzt alle "Deutschland" Locations auf None,
+Setzt alle Events mit der Location "Deutschland" zurück,
 damit der Geocoder diese Events neu verarbeiten kann.
+
+Nutzt die serverseitige Wartungs-Operation "regeocode" (siehe maintenance.py).
 """
 
-from utils import get_supabase_client
+import argparse
+from maintenance import DEFAULT_CHUNK_SIZE, run_operation
+
+
+def main(argv=None):
+    """Hauptfunktion"""
+    parser = argparse.ArgumentParser(description='Setzt alle "Deutschland" Locations für erneutes Geocoding zurück')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f'Maximale Zeilen pro Statement (Standard: {DEFAULT_CHUNK_SIZE})')
+    parser.add_argument('--dry-run', action='store_true', help='Nur zählen, nichts ändern')
+    args = parser.parse_args(argv)
+
+    print("🔄 Setze alle 'Deutschland' Locations zurück...")
 
-supabase = get_supabase_client()
+    count = run_operation('regeocode', {'location': 'Deutschland'},
+                          chunk_size=args.chunk_size, dry_run=args.dry_run)
 
-print("🔄 Setze alle 'Deutschland' Locations auf None...")
+    if args.dry_run:
+        print(f"🔎 {count} Events wären betroffen.")
+        return
 
-# Update alle Events mit location='Deutschland' auf None
-response = supabase.table('events')\
-    .update({"location": None})\
-    .eq("location", "Deutschland")\
-    .execute()
+    print(f"✓ {count} Events aktualisiert.")
+    print("   Diese Events werden beim nächsten Geocoding-Lauf neu verarbeitet.")
 
-print(f"✓ {len(response.data) if response.data else 0} Events aktualisiert.")
-print("   Diese Events werden beim nächsten Geocoding-Lauf neu verarbeitet.")
 
+if __name__ == '__main__':
+    main()
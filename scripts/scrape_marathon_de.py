@@ -3,21 +3,25 @@
 Skript zum Scrapen von Marathon-Events von marathon.de und Import in Supabase
 """
 
+import argparse
 import sys
 import re
-import time
-import requests
-from bs4 import BeautifulSoup
-from utils import get_supabase_client, parse_german_date, clean_text
+from datetime import date
+from changefeed import ChangeLog, diff_fields
+from utils import (EventRecord, get_supabase_client, get_rate_controller, host_of, parse_german_date, clean_text,
+                   THROTTLE_STATUS_CODES, MAX_THROTTLE_RETRIES)
 
-# Supabase-Verbindung
-try:
-    supabase = get_supabase_client()
-    print("✓ Verbindung zu Supabase hergestellt")
-except Exception as e:
-    print(f"Fehler beim Verbinden mit Supabase: {e}")
-    sys.exit(1)
+# Distanzen der gescrapten Kategorien, gerundet auf die Genauigkeit der Spalte
+# events.distance (NUMERIC(5,1)): 42.195 wird ohnehin als 42.2 gespeichert. Mit dem
+# gerundeten Wert findet diff_fields bei unveränderten Events keine Änderung.
+# Beide liegen innerhalb der Toleranz des Distanz-Filters im Dashboard (42.195 / 21.1).
+OFFICIAL_DISTANCES_KM = {
+    '42km': 42.2,
+    '21km': 21.1,
+}
 
+# Spalten, die upsert_events schreibt (werden für den Change-Feed verglichen)
+UPSERT_COLUMNS = ['name', 'title', 'type', 'category', 'location', 'date', 'description', 'distance']
 
 
 def scrape_marathon_events(url, distance_km):
@@ -26,8 +30,15 @@ def scrape_marathon_events(url, distance_km):
     Args:
         url: URL der zu scrapenden Seite
         distance_km: Distanz in km (z.B. '42km' oder '21km')
+
+    Returns:
+        Liste von EventRecord
     """
     
+    # Erst hier laden: requests und bs4 werden nur zum Scrapen gebraucht
+    import requests
+    from bs4 import BeautifulSoup
+
     print(f"📡 Lade Seite: {url}")
     
     # WICHTIG: User-Agent setzen, um vollständiges HTML zu erhalten
@@ -35,8 +46,26 @@ def scrape_marathon_events(url, distance_km):
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
     }
     
+    rate_controller = get_rate_controller()
+    host = host_of(url)
+
+    # Bei 429/503 dieselbe Seite nach der Pause erneut laden (es gibt nur zwei Seiten)
+    for attempt in range(MAX_THROTTLE_RETRIES + 1):
+        rate_controller.wait(host)
+
+        try:
+            response = requests.get(url, headers=headers, timeout=15)
+        except Exception as e:
+            rate_controller.record(host, error=True)
+            print(f"⚠️ Fehler beim Laden von {url}: {e}")
+            return []
+
+        rate_controller.record(host, status=response.status_code, retry_after=response.headers.get('Retry-After'))
+        if response.status_code not in THROTTLE_STATUS_CODES or attempt == MAX_THROTTLE_RETRIES:
+            break
+        print(f"⏳ Gedrosselt (HTTP {response.status_code}), neuer Versuch {attempt + 1}/{MAX_THROTTLE_RETRIES}...")
+
     try:
-        response = requests.get(url, headers=headers, timeout=15)
         response.raise_for_status()
     except Exception as e:
         print(f"⚠️ Fehler beim Laden von {url}: {e}")
@@ -48,7 +77,8 @@ def scrape_marathon_events(url, distance_km):
     soup = BeautifulSoup(response.content, 'html.parser')
     
     events = []
-    distance_val = float(distance_km.replace('km', ''))
+    seen_keys = set()
+    distance_val = OFFICIAL_DISTANCES_KM.get(distance_km) or float(distance_km.replace('km', ''))
     
     # --- INTELLIGENTE DOM-SUCHE START ---
     print("📋 Versuche intelligente DOM-Suche (Datum -> Container -> Link)")
@@ -157,20 +187,19 @@ def scrape_marathon_events(url, distance_km):
                 if link_url.startswith('/'):
                     link_url = f"https://www.marathon.de{link_url}"
 
-            event_obj = {
-                "name": clean_name,
-                "date": event_date.strftime("%Y-%m-%d"),
-                "location": None, # Wir lassen das leer, damit der Geocoder weiß: Hier muss ich ran
-                "distance": distance_val, 
-                "link": link_url,
-                "type": "Laufen",
-                "category": "Laufen"
-            }
+            event_obj = EventRecord(
+                name=clean_name,
+                date=event_date.date(),
+                distance=distance_val,
+                link=link_url,
+                category="Laufen",
+                type="Laufen",
+                location=None,  # Wir lassen das leer, damit der Geocoder weiß: Hier muss ich ran
+            )
 
             # Duplikat-Check (in dieser Laufzeit)
-            is_duplicate = any(e['name'] == event_obj['name'] and e['date'] == event_obj['date'] for e in events)
-            
-            if not is_duplicate:
+            if event_obj.key not in seen_keys:
+                seen_keys.add(event_obj.key)
                 events.append(event_obj)
                 current_page_events += 1
 
@@ -195,87 +224,111 @@ def scrape_marathon_events(url, distance_km):
     return events
 
 def upsert_events(events):
-    """Fügt Events in die Datenbank ein (Update or Insert)"""
+    """Fügt Events (Liste von EventRecord) in die Datenbank ein (Update or Insert)"""
     if not events:
         return 0
     
+    supabase = get_supabase_client()
+    rate_controller = get_rate_controller()
+    change_log = ChangeLog(supabase)
+
     print(f"\n💾 Füge {len(events)} Events in die Datenbank ein...")
     
     inserted_count = 0
     updated_count = 0
+    unchanged_count = 0
+    past_count = 0
     error_count = 0
+    today = date.today()
     
     for i, event in enumerate(events, 1):
+        # Vergangene Events liegen evtl. schon in events_archive (Archiv-Job läuft vor
+        # dem Scraper). Ein erneuter Insert würde dort später ein Duplikat erzeugen.
+        if event.date < today:
+            past_count += 1
+            continue
+
+        # Pause nur, wenn die Datenbank zuvor Fehler gemeldet hat
+        rate_controller.wait('supabase')
         try:
-            # Erstelle einen eindeutigen Identifier aus Name und Datum
-            # Für Upsert nutzen wir eine Kombination aus Name und Datum
-            event_name = event.get('name', '')
-            event_date = event.get('date', '')
+            # Bereite Event-Daten vor (das Dict entsteht erst beim Schreiben)
+            event_data = event.to_payload()
             
             # Prüfe, ob Event bereits existiert (basierend auf Name und Datum)
             existing = supabase.table('events')\
-                .select('id')\
-                .eq('name', event_name)\
-                .eq('date', event_date)\
+                .select(','.join(['id'] + UPSERT_COLUMNS))\
+                .eq('name', event_data['name'])\
+                .eq('date', event_data['date'])\
                 .execute()
             
-            # Bereite Event-Daten vor
-            event_data = {
-                'name': event.get('name'),
-                'title': event.get('name'),  # Auch title setzen
-                'type': event.get('type', 'Laufen'),
-                'category': event.get('category', 'Laufen'),
-                'location': event.get('location'),  # None wenn nicht vorhanden - Geocoder übernimmt
-                'date': event.get('date'),
-                'description': f"Marathon-Event: {event.get('name', '')}",
-            }
-            
-            # Füge Distanz hinzu, falls vorhanden
-            if event.get('distance'):
-                event_data['distance'] = event.get('distance')
-            
-            # Setze optionale Felder, falls vorhanden
-            if event.get('link'):
-                if not event_data.get('description'):
-                    event_data['description'] = ''
-                event_data['description'] += f"\nLink: {event.get('link')}"
-            
             if existing.data and len(existing.data) > 0:
-                # Update bestehendes Event
+                # Update bestehendes Event - nur wenn sich wirklich etwas geändert hat
                 event_id = existing.data[0]['id']
-                supabase.table('events')\
-                    .update(event_data)\
-                    .eq('id', event_id)\
-                    .execute()
-                updated_count += 1
+                changed_fields = diff_fields(existing.data[0], event_data)
+                if changed_fields:
+                    supabase.table('events')\
+                        .update(changed_fields)\
+                        .eq('id', event_id)\
+                        .execute()
+                    change_log.record('update', event_id, changed_fields)
+                    updated_count += 1
+                else:
+                    unchanged_count += 1
                 if i % 10 == 0:
                     print(f"  ✓ {i}/{len(events)} Events verarbeitet...")
             else:
                 # Insert neues Event
-                supabase.table('events')\
+                result = supabase.table('events')\
                     .insert(event_data)\
                     .execute()
+                if result.data:
+                    change_log.record('insert', result.data[0]['id'], event_data)
                 inserted_count += 1
                 if i % 10 == 0:
                     print(f"  ✓ {i}/{len(events)} Events verarbeitet...")
-            
-            # Höflich zum Server: kurze Pause
-            time.sleep(0.5)
+
+            rate_controller.record('supabase')
             
         except Exception as e:
+            rate_controller.record('supabase', error=True)
             error_count += 1
-            print(f"  ✗ Fehler bei Event {i} ({event.get('name', 'Unbekannt')}): {e}")
+            print(f"  ✗ Fehler bei Event {i} ({event.name or 'Unbekannt'}): {e}")
+
+        # Außerhalb des try: Change-Feed-Probleme zählen nicht als Event-Fehler
+        change_log.flush_if_full()
     
+    change_log.flush()
+
     print(f"\n✅ Fertig:")
     print(f"  • {inserted_count} neue Events eingefügt")
     print(f"  • {updated_count} Events aktualisiert")
+    print(f"  • {unchanged_count} Events unverändert")
+    if past_count > 0:
+        print(f"  • {past_count} vergangene Events übersprungen")
+    print(f"  • {change_log.written} Einträge im Change-Feed")
+    if change_log.failed > 0:
+        print(f"  • {change_log.failed} Change-Feed-Einträge nicht geschrieben")
     if error_count > 0:
         print(f"  • {error_count} Fehler")
     
     return inserted_count + updated_count
 
-def main():
+def main(argv=None):
     """Hauptfunktion"""
+    parser = argparse.ArgumentParser(description='Scrapt Marathon-Events von marathon.de und importiert sie in Supabase')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='Nur scrapen und anzeigen, nichts in die Datenbank schreiben')
+    args = parser.parse_args(argv)
+
+    if not args.dry_run:
+        # Supabase-Verbindung
+        try:
+            get_supabase_client()
+            print("✓ Verbindung zu Supabase hergestellt")
+        except Exception as e:
+            print(f"Fehler beim Verbinden mit Supabase: {e}")
+            sys.exit(1)
+
     print("\n🚀 Starte Scraping von Marathon.de...\n")
     
     all_events = []
@@ -289,8 +342,7 @@ def main():
     else:
         print("⚠️  Keine Marathon-Events gefunden\n")
     
-    # Kurze Pause zwischen Requests
-    time.sleep(1)
+    # Pause zwischen den Seiten übernimmt der RateController (pro Host)
     
     # Scrape Halbmarathon-Events (21km)
     print("🏃 Scrape Halbmarathon-Events (21km)...")
@@ -304,6 +356,7 @@ def main():
     if not all_events:
         print("\n⚠️  Keine Events gefunden. Möglicherweise hat sich die Struktur der Website geändert.")
         print("   Bitte überprüfe die Seite manuell oder passe die Selektoren an.")
+        get_rate_controller().report()
         return
     
     print(f"\n📊 Gesamt gefunden: {len(all_events)} Events")
@@ -312,14 +365,19 @@ def main():
     if all_events:
         print("\n📋 Erste Events (Beispiel) - Vollständige Namen:")
         for event in all_events[:3]:
-            distance_str = f"{event.get('distance', 'N/A')}km" if event.get('distance') else 'N/A'
-            event_name = event.get('name', 'N/A')
-            print(f"  • {event.get('date')} - {event_name} ({event.get('location', 'N/A')}) - {distance_str}")
+            distance_str = f"{event.distance}km" if event.distance else 'N/A'
+            print(f"  • {event.date.isoformat()} - {event.name} ({event.location or 'N/A'}) - {distance_str}")
     
+    if args.dry_run:
+        print(f"\n🔎 Dry-Run: {len(all_events)} Events gefunden, nichts importiert.\n")
+        get_rate_controller().report()
+        return
+
     # Füge Events in die Datenbank ein
     total_imported = upsert_events(all_events)
     
     print(f"\n✨ Erfolgreich {total_imported} Events von Marathon.de importiert\n")
+    get_rate_controller().report()
 
 if __name__ == '__main__':
     main()
@@ -3,23 +3,12 @@
 Skript zum Befüllen der Supabase-Datenbank mit Test-Events
 """
 
+import argparse
 import sys
 from datetime import datetime, timedelta
 import random
-from faker import Faker
 from utils import get_supabase_client
 
-# Initialisiere Faker mit deutschem Locale
-fake = Faker('de_DE')
-
-# Supabase-Verbindung
-try:
-    supabase = get_supabase_client()
-    print("✓ Verbindung zu Supabase hergestellt")
-except Exception as e:
-    print(f"Fehler beim Verbinden mit Supabase: {e}")
-    sys.exit(1)
-
 # Deutsche Städte
 DEUTSCHE_STAEDTE = [
     "Berlin", "München", "Hamburg", "Köln", "Frankfurt am Main",
@@ -176,8 +165,19 @@ def generate_event(event_type: str):
         'capacity': capacity,
     }
 
-def main():
+def main(argv=None):
     """Hauptfunktion"""
+    parser = argparse.ArgumentParser(description='Befüllt die Datenbank mit Test-Events (löscht vorhandene Events!)')
+    parser.parse_args(argv)
+
+    # Supabase-Verbindung
+    try:
+        supabase = get_supabase_client()
+        print("✓ Verbindung zu Supabase hergestellt")
+    except Exception as e:
+        print(f"Fehler beim Verbinden mit Supabase: {e}")
+        sys.exit(1)
+
     print("\n🚀 Starte Seed-Prozess für Events...\n")
     
     try:
@@ -3,20 +3,35 @@ Gemeinsame Utility-Funktionen für Scraping-Skripte
 """
 import os
 import re
-from datetime import datetime
+import sys
+import time
+from datetime import date, datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
 from dotenv import load_dotenv
-from supabase import create_client, Client
 
 # Lade Umgebungsvariablen aus .env.local (falls vorhanden)
 # In GitHub Actions werden die Variablen direkt als Environment-Variablen gesetzt
 load_dotenv('.env.local', override=False)
 
+# Einmal erstellter Client (siehe get_supabase_client)
+_supabase_client = None
+
 
 def get_supabase_client():
     """
     Erstellt und gibt einen Supabase-Client zurück.
     Nutzt Umgebungsvariablen aus .env.local oder direkte Environment-Variablen.
+
+    Das supabase-Paket wird erst hier importiert und der Client nur einmal pro
+    Prozess erstellt, damit Skripte ohne Datenbank-Zugriff (z.B. --help) schnell starten.
     """
+    global _supabase_client
+    if _supabase_client is not None:
+        return _supabase_client
+
+    from supabase import create_client
+
     url = os.getenv('NEXT_PUBLIC_SUPABASE_URL')
     key = os.getenv('NEXT_PUBLIC_SUPABASE_ANON_KEY')
     
@@ -24,7 +39,63 @@ def get_supabase_client():
         raise ValueError('NEXT_PUBLIC_SUPABASE_URL oder NEXT_PUBLIC_SUPABASE_ANON_KEY nicht gefunden. '
                         'Bitte setze diese als Umgebungsvariablen oder in .env.local')
     
-    return create_client(url, key)
+    _supabase_client = create_client(url, key)
+    return _supabase_client
+
+
+def iter_event_batches(supabase, columns='*', batch_size=1000, after=None, table='events',
+                       upcoming=True, date_from=None):
+    """
+    Liest die Events-Tabelle seitenweise (Keyset-Pagination über created_at, id).
+
+    Im Gegensatz zu einem einzelnen select('*') wird nie die ganze Tabelle auf einmal
+    übertragen, und jede Seite kostet gleich viel - auch bei großen Tabellen.
+    Standardmäßig werden nur kommende Events (date >= heute) gelesen; für die
+    komplette Historie upcoming=False und ggf. table='events_all' verwenden.
+
+    Args:
+        supabase: Supabase-Client
+        columns: Spalten für select() (created_at und id werden bei Bedarf ergänzt)
+        batch_size: Anzahl Zeilen pro Anfrage
+        after: Optionaler Cursor (created_at, id); nur Zeilen danach werden gelesen
+        table: Name der Tabelle oder View
+        upcoming: Nur Events ab heute lesen
+        date_from: Optionales Datum (YYYY-MM-DD); nur Events ab diesem Tag (hat Vorrang)
+
+    Yields:
+        Listen von Event-Dicts, sortiert nach created_at und id
+    """
+    if columns != '*':
+        wanted = [c.strip() for c in columns.split(',')]
+        for key in ('created_at', 'id'):
+            if key not in wanted:
+                wanted.append(key)
+        columns = ','.join(wanted)
+
+    if date_from is None and upcoming:
+        date_from = date.today().isoformat()
+
+    cursor = after
+    while True:
+        query = supabase.table(table).select(columns).order('created_at').order('id')
+        if date_from:
+            query = query.gte('date', str(date_from))
+        if cursor:
+            created_at, event_id = cursor
+            # Zeitstempel enthalten ':' und '+', daher in Anführungszeichen
+            query = query.or_(
+                f'created_at.gt."{created_at}",'
+                f'and(created_at.eq."{created_at}",id.gt.{event_id})'
+            )
+        rows = query.limit(batch_size).execute().data or []
+        if not rows:
+            return
+
+        yield rows
+
+        if len(rows) < batch_size:
+            return
+        cursor = (rows[-1]['created_at'], rows[-1]['id'])
 
 
 def parse_german_date(date_str):
@@ -61,3 +132,245 @@ def clean_text(text):
         return ""
     return re.sub(r'\s+', ' ', str(text).strip())
 
+
+
+
+class EventRecord:
+    """
+    Kompakte Darstellung eines gescrapten Events in der Python-Pipeline.
+
+    Statt eines Dicts mit String-Datum und doppelten Feldern (name/title,
+    description aus name und link) werden nur die Grunddaten typisiert gehalten:
+    `date` als datetime.date, `distance` als float, `category`/`type` interniert.
+    Das Datenbank-Payload entsteht erst beim Schreiben (to_payload).
+    """
+
+    __slots__ = ('name', 'date', 'distance', 'link', 'category', 'type', 'location')
+
+    def __init__(self, name, date, distance=None, link=None, category='Laufen', type=None, location=None):
+        self.name = name
+        self.date = date
+        self.distance = float(distance) if distance is not None else None
+        self.link = link or None
+        self.category = sys.intern(category) if category else None
+        self.type = sys.intern(type) if type else self.category
+        self.location = location
+
+    @property
+    def key(self):
+        """Identität eines Events (Name und Datum), wie beim Upsert."""
+        return (self.name, self.date)
+
+    def to_payload(self):
+        """Baut das Dict für die events-Tabelle (gleiche Spalten wie bisher)."""
+        description = f"Marathon-Event: {self.name}"
+        if self.link:
+            description += f"\nLink: {self.link}"
+
+        payload = {
+            'name': self.name,
+            'title': self.name,  # Auch title setzen
+            'type': self.type or 'Laufen',
+            'category': self.category or 'Laufen',
+            'location': self.location,  # None wenn nicht vorhanden - Geocoder übernimmt
+            'date': self.date.isoformat(),
+            'description': description,
+        }
+        if self.distance:
+            payload['distance'] = self.distance
+        return payload
+
+    def __repr__(self):
+        return f"EventRecord({self.name!r}, {self.date.isoformat()}, distance={self.distance})"
+
+
+_GEOHASH_BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+
+
+def encode_geohash(lat, lng, precision=4):
+    """
+    Kodiert Koordinaten als Geohash (z.B. für eine grobe Kachel-Einteilung).
+
+    Args:
+        lat: Breitengrad
+        lng: Längengrad
+        precision: Anzahl Zeichen (4 entspricht ca. 39 x 20 km)
+
+    Returns:
+        Geohash-String
+    """
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True
+
+    while len(chars) < precision:
+        value, value_range = (lng, lng_range) if even else (lat, lat_range)
+        mid = (value_range[0] + value_range[1]) / 2
+        if value >= mid:
+            bits = (bits << 1) | 1
+            value_range[0] = mid
+        else:
+            bits = bits << 1
+            value_range[1] = mid
+        even = not even
+
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_GEOHASH_BASE32[bits])
+            bits = 0
+            bit_count = 0
+
+    return ''.join(chars)
+
+
+# Pausen-Budgets pro Host (Sekunden zwischen zwei Anfragen)
+#   min_interval: dokumentiertes bzw. höfliches Minimum, schneller wird nie angefragt
+#   start_interval: Pause zu Beginn des Laufs (Standard: min_interval)
+#   max_interval: Obergrenze beim Zurückfahren nach Fehlern
+HOST_BUDGETS = {
+    # Nominatim Usage Policy: maximal 1 Anfrage pro Sekunde
+    'nominatim.openstreetmap.org': {'min_interval': 1.0, 'max_interval': 60.0},
+    'www.marathon.de': {'min_interval': 0.5, 'start_interval': 1.0, 'max_interval': 30.0},
+    # Datenbank-Schreibzugriffe brauchen keine Höflichkeitspause
+    'supabase': {'min_interval': 0.0, 'max_interval': 10.0},
+}
+DEFAULT_HOST_BUDGET = {'min_interval': 1.0, 'max_interval': 30.0}
+
+# Anpassung des Intervalls nach einer Antwort
+RATE_SPEEDUP_FACTOR = 0.8    # gesunde Antwort: Intervall schrumpft Richtung min_interval
+RATE_BACKOFF_FACTOR = 2.0    # Fehler / 429 / 503: Intervall verdoppelt sich
+RATE_BACKOFF_FLOOR = 1.0     # Mindest-Pause nach einem Fehler (auch für min_interval = 0)
+
+# Antworten, nach denen dieselbe Anfrage (nach der Pause) wiederholt wird
+THROTTLE_STATUS_CODES = (429, 503)
+MAX_THROTTLE_RETRIES = 3
+
+
+def parse_retry_after(value):
+    """
+    Parst einen Retry-After-Header (Sekunden oder HTTP-Datum).
+
+    Returns:
+        Wartezeit in Sekunden oder None
+    """
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return max(0.0, float(value))
+
+    value = str(value).strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def host_of(url):
+    """Hostname einer URL (für die Zuordnung zum Budget)."""
+    return urlparse(url).hostname or url
+
+
+class RateController:
+    """
+    Adaptive Pausen zwischen Anfragen, getrennt nach Host.
+
+    Vor jeder Anfrage wait(host) aufrufen, danach record(host, ...) mit dem Ergebnis.
+    Gesunde Antworten verkürzen die Pause bis zum min_interval des Hosts,
+    Fehler sowie 429/503 verlängern sie. Ein Retry-After des Servers hat Vorrang.
+    Gedrosselte Anfragen wiederholt der Aufrufer (bis MAX_THROTTLE_RETRIES) nach
+    einem erneuten wait(host).
+    """
+
+    def __init__(self, budgets=None, sleep=time.sleep, clock=time.monotonic):
+        self.budgets = dict(HOST_BUDGETS, **(budgets or {}))
+        self.sleep = sleep
+        self.clock = clock
+        self.intervals = {}
+        self.next_allowed = {}
+        self.sleep_by_host = {}
+
+    def _budget(self, host):
+        return self.budgets.get(host, DEFAULT_HOST_BUDGET)
+
+    def interval(self, host):
+        budget = self._budget(host)
+        return self.intervals.get(host, budget.get('start_interval', budget['min_interval']))
+
+    def wait(self, host):
+        """Schläft, bis die nächste Anfrage an `host` erlaubt ist."""
+        now = self.clock()
+        delay = self.next_allowed.get(host, now) - now
+        if delay > 0:
+            self.sleep(delay)
+            self.sleep_by_host[host] = self.sleep_by_host.get(host, 0.0) + delay
+            now += delay
+        self.next_allowed[host] = now + self.interval(host)
+
+    def record(self, host, status=None, retry_after=None, error=False):
+        """
+        Passt das Intervall nach einer Antwort an.
+
+        Args:
+            host: Host der Anfrage
+            status: HTTP-Status (falls bekannt)
+            retry_after: Retry-After-Wert (Header-String oder Sekunden)
+            error: True bei Exceptions/Timeouts ohne Status
+        """
+        budget = self._budget(host)
+        current = self.interval(host)
+        throttled = status in THROTTLE_STATUS_CODES
+
+        if error or throttled or (status is not None and status >= 500):
+            interval = min(budget['max_interval'], max(current * RATE_BACKOFF_FACTOR, RATE_BACKOFF_FLOOR))
+        else:
+            interval = current * RATE_SPEEDUP_FACTOR
+            # Rest-Pausen im Millisekundenbereich lohnen sich nicht
+            if interval - budget['min_interval'] < 0.05:
+                interval = budget['min_interval']
+        self.intervals[host] = interval
+
+        now = self.clock()
+        wait_until = self.next_allowed.get(host, now)
+        if error or throttled:
+            wait_until = max(wait_until, now + interval)
+
+        retry_seconds = parse_retry_after(retry_after)
+        if retry_seconds is not None:
+            wait_until = max(wait_until, now + retry_seconds)
+
+        self.next_allowed[host] = wait_until
+
+    @property
+    def total_sleep(self):
+        return sum(self.sleep_by_host.values())
+
+    def report(self):
+        """Gibt die gesamte Wartezeit des Laufs aus."""
+        print(f"⏱️  Pausen gesamt: {self.total_sleep:.1f}s")
+        for host, seconds in sorted(self.sleep_by_host.items()):
+            print(f"   • {host}: {seconds:.1f}s")
+
+
+# Gemeinsamer Controller für einen Lauf (siehe get_rate_controller)
+_rate_controller = None
+
+
+def get_rate_controller():
+    """Gibt den gemeinsamen RateController des Prozesses zurück."""
+    global _rate_controller
+    if _rate_controller is None:
+        _rate_controller = RateController()
+    return _rate_controller